@@ -15,25 +15,19 @@ Identity
 
 import turtle
 t = turtle.Pen()
+turtle.tracer(0, 0)
 
 t.color('blue','green')
 t.begin_fill()
 
-count = 0
-
-#draw a star
-for x in range(1,333):
+#draw a star - exactly 8 points
+for x in range(8):
     t.forward(300)
     t.left(225)
-    count = count+1
-    print("Count is: " + str(count))
-    
-    #stop drawing after 8 loops
-    #if count > 7 and count > 12:
-    if count > 7:
-        print("The star pattern is complete!")
-        break
-    
-    
+print("The star pattern is complete!")
+
 t.end_fill()
+turtle.update()
 print("A star is born!")
+
+turtle.done()
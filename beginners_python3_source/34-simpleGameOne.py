@@ -1,9 +1,12 @@
-import time
+import asyncio
+
+# answers that count as a yes
+_YES = frozenset({"yes", "y"})
 
 # define functions:
 
-def displayLesson():
-    time.sleep(1)
+async def displayLesson():
+    await asyncio.sleep(1)
     print('''
 This is a multiline text string ...
 I can write it across several lines. You use triple quotes
@@ -11,21 +14,21 @@ to make it happen.
 
 .... The program has ended.''')
 
-def useTime():
+async def useTime():
     print("Shut down requested.")
-    time.sleep(1)
+    await asyncio.sleep(1)
     print("3 seconds to shutdown ...")
-    time.sleep(2)
+    await asyncio.sleep(2)
     print("Going offline ...")
 
 def flowControl():
+    # plain input() so Ctrl-C at the prompt still quits; only the pauses use asyncio
     answer = input("Do you want to learn about multiline text strings? (yes or no)\n -> ")
 
-    #if answer == "yes" or answer == "y":
-    if answer == ("yes" or "y"):
-        displayLesson()
+    if answer.strip().lower() in _YES:
+        asyncio.run(displayLesson())
     else:
-        useTime()
+        asyncio.run(useTime())
         print("End program")
        
 # execute program:
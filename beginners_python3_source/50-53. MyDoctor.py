@@ -1,7 +1,13 @@
 # docstrings
 
+# answers that count as a yes
+_YES = frozenset({"yes", "y"})
+
 class MyDoctor:
     '''-> MyDoctor class docstring ... tell programmers about your class.'''     
+
+    # no per-instance attributes, so skip the per-instance __dict__
+    __slots__ = ()
     
     def sayHi(self):
         print("Hi!")
@@ -11,12 +17,12 @@ class MyDoctor:
         print("Bye")
 
     def askDocQuestion(self):
-        question = input("Do you want a health tip? Yes or no.")
+        question = input("Do you want a health tip? Yes or no.").strip().lower()
 
         #if yes, python says: Good! Eat less sugar.
         #if !yes, Ok, see you next time.
 
-        if question == "yes" or question == "Yes":
+        if question in _YES:
             print("Good! Eat less sugar.")
         else:
             print("Ok, see you next time.") 
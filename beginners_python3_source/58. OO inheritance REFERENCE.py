@@ -39,7 +39,7 @@ class Truck(AutoMobile):
     
 
 
-my_truck = truck()
+my_truck = Truck()
 print("My trucks model year: " + my_truck.model_year)
 
 # overriding default behavior with special __str__ method
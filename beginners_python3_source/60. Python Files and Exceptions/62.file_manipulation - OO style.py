@@ -1,5 +1,7 @@
 # file manipulation
 
+import os
+
 '''with open('system_config.txt') as file_object:
         contents = file_object.read()
         print(contents)'''
@@ -18,17 +20,31 @@ def openFile2(file):
 
 class Filer():
 
-    def openFile(self):
-        with open('system_config.txt') as file_object:
+    # file contents already read, keyed by absolute path: ((mtime_ns, size), contents)
+    _cache = {}
+
+    #read a file, reusing the cached contents while the file is unchanged
+    def _read(self, path):
+        key = os.path.abspath(path)
+        with open(path) as file_object:
+            st = os.fstat(file_object.fileno())
+            version = (st.st_mtime_ns, st.st_size)
+            cached = Filer._cache.get(key)
+            if cached and cached[0] == version:
+                return cached[1]
             contents = file_object.read()
-            print(contents)
+        Filer._cache[key] = (version, contents)
+        return contents
+
+    def openFile(self):
+        print(self._read('system_config.txt'))
 
     #open file function with argument
     def openFile2(self,file):
-        with open(file) as file_object:
-            contents = file_object.read()
-            print(contents)     
+        print(self._read(file))
 
-myFiler = Filer()
-myFiler.openFile()
-myFiler.openFile2('system_config.txt')
+# only run the demo when this lesson is run, not when lesson 63 loads Filer from it
+if __name__ == "__main__":
+    myFiler = Filer()
+    myFiler.openFile()
+    myFiler.openFile2('system_config.txt')
@@ -3,12 +3,18 @@
 # Mac path: /Users/stefanmischook/Desktop/python ch8/people2.txt
 # Win path: c:\Users\(username)\Desktop\python ch8\people2.txt
 
-class Filer():
+import importlib.util
+import os
 
-    def openFile(self):
-        with open('system_config.txt') as file_object:
-            contents = file_object.read()
-            print(contents)
+# reuse the Filer class from lesson 62 - its file name has spaces and dots,
+# so it has to be loaded by path instead of with a plain import
+_spec = importlib.util.spec_from_file_location(
+    "oo_style", os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "62.file_manipulation - OO style.py"))
+_ooStyle = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_ooStyle)
+
+class Filer(_ooStyle.Filer):
 
     #open file function with argument
     def openFile2(self,file):
@@ -1,14 +1,41 @@
+import locale
+import mmap
+import os
 import re
+import sys
+
+# every pattern this module uses, compiled once at import
+_PATTERNS = {
+    'lucy_end': re.compile(r'LUcy$'),
+}
+
+# read the file in 128 KiB chunks instead of the default 8 KiB
+READ_BUFFER_SIZE = 131072
+
+def openForReading(file):
+# text mode reads _CHUNK_SIZE bytes at a time no matter what buffering= says
+    file_object = open(file, 'r')
+    file_object._CHUNK_SIZE = READ_BUFFER_SIZE
+    return file_object
+
+# most lines to hold before writing them out
+WRITE_BATCH_LINES = 1024
+
+def flushLines(buffer):
+# write the buffered lines in one call, same output as print(line) for each
+    if buffer:
+        sys.stdout.write("\n".join(buffer) + "\n")
+        buffer.clear()
 
 def readingLines():
-    count = 0
 
     try:
-        with open('people.txt') as file_object:
-            contents = file_object.readlines()
-            for line in contents:
-                count += 5
-                print("Line " + str(count) + ": " + line)
+        with openForReading('people.txt') as file_object:
+            for lineNumber, line in enumerate(file_object, start=1):
+                sys.stdout.write(f"Line {lineNumber}: {line}")
+                # the last line may not end with a newline
+                if not line.endswith("\n"):
+                    sys.stdout.write("\n")
     except OSError as booboo:
          
           print("We had a booboo!!")
@@ -17,9 +44,8 @@ def readingLines():
 def readingLinesAndSearch():
 
     try:
-        with open('people.txt') as file_object:
-            contents = file_object.readlines()
-            for line in contents:
+        with openForReading('people.txt') as file_object:
+            for line in file_object:
                 if line.rstrip() == "Lucy":
                     print("-> We found Lucy!\n")                   
                 else:
@@ -34,15 +60,44 @@ def readingLinesAndSearch():
 def readingLinesWithFind():
 
     try:
-        with open('people.txt') as file_object:
-            contents = file_object.readlines()
-            for line in contents:
-                hit = line.find("Lucy")
-                
-                if hit != -1:
-                    print("-> We found Lucy in the line of text!\n")                   
-                else:
-                    print(line)
+        with open('people.txt', 'rb') as file_object:
+            # mmap can't map an empty file
+            if os.fstat(file_object.fileno()).st_size == 0:
+                return
+            # decode like text mode would: locale encoding, \r\n and \r become \n
+            encoding = locale.getpreferredencoding(False)
+            found = "-> We found Lucy in the line of text!\n\n"
+            with mmap.mmap(file_object.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                start = 0
+                while start < len(mm):
+                    # take READ_BUFFER_SIZE bytes, cut after the last line ending
+                    stop = len(mm)
+                    if stop - start > READ_BUFFER_SIZE:
+                        window = start + READ_BUFFER_SIZE
+                        cut = mm.rfind(b"\n", start, window)
+                        if cut == -1:
+                            cut = mm.rfind(b"\r", start, window - 1)
+                        if cut != -1:
+                            stop = cut + 1
+                    text = mm[start:stop].decode(encoding)
+                    if "\r" in text:
+                        text = text.replace("\r\n", "\n").replace("\r", "\n")
+                    start = stop
+
+                    # same output as print(line) for each line, or the found message
+                    if "Lucy" not in text:
+                        out = text.replace("\n", "\n\n")
+                        # print() ends the last line even when the file doesn't
+                        if not text.endswith("\n"):
+                            out += "\n"
+                    else:
+                        lines = text.split("\n")
+                        last = lines.pop()
+                        out = "".join(
+                            found if "Lucy" in line else line + "\n\n" for line in lines)
+                        if last:
+                            out += found if "Lucy" in last else last + "\n"
+                    sys.stdout.write(out)
                     
     except OSError as booboo:
          
@@ -50,24 +105,26 @@ def readingLinesWithFind():
           print(booboo)
 
 
-def regExMagic(pattern, string):
-# regEx - the search() function checks for a match anywhere in the string
-   objectMatch = re.search(pattern, string)
-   return objectMatch
-         
 def readingLinesWithRegEx():
 
     try:
-        with open('people.txt') as file_object:
-            contents = file_object.readlines()
+        with openForReading('people.txt') as file_object:
             print("\n")
-            for line in contents:
+            regex = _PATTERNS['lucy_end']
+            pattern = regex.pattern
+            buffer = []
+            for line in file_object:
 
-                pattern = 'LUcy$'
-                if str(regExMagic(pattern, line)) == "None": 
-                    print(line)
+                # regEx - the search() method checks for a match anywhere in the string
+                match = regex.search(line)
+                if match is None:
+                    buffer.append(line)
+                    if len(buffer) >= WRITE_BATCH_LINES:
+                        flushLines(buffer)
                 else:
-                    print("-- > We the text: " + pattern + ", in this line: " + line + "\n")
+                    flushLines(buffer)
+                    print(f"-- > We found the text: {pattern}, in this line: {line}\n")
+            flushLines(buffer)
                     
     except OSError as booboo:
          
@@ -1,11 +1,23 @@
 
 
 # Introduction to Drawing with Turtle
+import time
 import turtle
 
 print("Introduction to Drawing with Turtle")
 t = turtle.Pen()
 
+# draw off-screen and refresh once per drawing, not once per move
+turtle.tracer(0, 0)
+
+# show the finished drawing, and keep the window responsive while it is up
+def show_drawing(seconds=2):
+    turtle.update()
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        turtle.update()
+        time.sleep(0.02)
+
 t.forward(200)
 t.left(45)
 t.forward(150)
@@ -15,6 +27,7 @@ t.left(180)
 t.forward(340)
 t.right(90)
 t.forward(234)
+show_drawing()
 t.reset()
 print("done\n")
 
@@ -49,6 +62,7 @@ for x in range(1,5):
     t.forward(50)
     t.left(90)
     t.forward(100)
+show_drawing()
 t.reset()
 print("done\n")
 
@@ -57,6 +71,7 @@ print("Drawing a mystery object")
 for x in range(1,9):
     t.forward(100)
     t.left(225)
+show_drawing()
 t.reset()
 print("done\n")
 
@@ -66,24 +81,15 @@ print("Drawing a star with loops and colors")
 t.color("red", "blue")
 t.begin_fill()
 
-count = 0
-for x in range(1, 777):
+# the star is exactly 8 points
+for x in range(8):
     t.forward(300)
     t.left(225)
-    count += 1
-    print("count is: ", str(count))
-    print("x is: ", str(x))
-
-    # stop drawing after 8 loops
-    if count > 7 and count < 9:
-        print("the star pattern is complete")
-        break
-
-print("count is: ", str(count))
-print("x is: ", str(x))
+print("the star pattern is complete")
 
 t.end_fill()
-
-t.reset()
+turtle.update()
 print("done\n")
 
+# leave the star up until the window is closed
+turtle.done()